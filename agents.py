@@ -9,12 +9,18 @@ These agents do the actual work:
 For learning, we'll SIMULATE the API calls instead of making real ones.
 """
 
+import asyncio
+import logging
+import secrets
+import sys
 from state import AgentState
-import random
-import string
 
+# Trace output for the demo. main.py switches it on; when these agents
+# are used as a library the traces are skipped without being formatted.
+log = logging.getLogger("hcm_agent")
 
-def role_agent(state: AgentState) -> AgentState:
+
+async def role_agent(state: AgentState) -> AgentState:
     """
     Assigns a role to a user.
 
@@ -22,69 +28,77 @@ def role_agent(state: AgentState) -> AgentState:
     For learning, we'll just simulate it!
     """
 
-    print(f"\n👤 ROLE AGENT: Assigning role '{state['extra_info']}' to user '{state['username']}'")
-
-    # Simulate API call
-    print("   📡 Calling Fusion HCM API... (simulated)")
-    print(f"   POST /api/users/{state['username']}/roles")
-    print(f"   Body: {{ 'role': '{state['extra_info']}' }}")
+    # Simulate API call, then success
+    state.result = f"✓ Successfully assigned role '{state.extra_info}' to {state.username}"
+    state.next_step = "end"
 
-    # Simulate success
-    state["result"] = f"✓ Successfully assigned role '{state['extra_info']}' to {state['username']}"
-    state["next_step"] = "end"
-
-    print(f"   {state['result']}")
+    # Only build the trace if someone is going to see it
+    if log.isEnabledFor(logging.INFO):
+        log.info("\n".join([
+            f"\n👤 ROLE AGENT: Assigning role '{state.extra_info}' to user '{state.username}'",
+            "   📡 Calling Fusion HCM API... (simulated)",
+            f"   POST /api/users/{state.username}/roles",
+            f"   Body: {{ 'role': '{state.extra_info}' }}",
+            f"   {state.result}",
+        ]))
 
     return state
 
 
-def password_agent(state: AgentState) -> AgentState:
+async def password_agent(state: AgentState) -> AgentState:
     """
     Resets a user's password.
 
     Generates a random password and 'resets' it.
     """
 
-    print(f"\n🔑 PASSWORD AGENT: Resetting password for user '{state['username']}'")
-
-    # Generate a random password
-    new_password = ''.join(random.choices(string.ascii_letters + string.digits, k=12))
+    # Generate a random password (9 random bytes -> 12 URL-safe characters)
+    new_password = secrets.token_urlsafe(9)
 
-    print("   📡 Calling Fusion HCM API... (simulated)")
-    print(f"   PATCH /api/users/{state['username']}")
-    print(f"   Body: {{ 'password': '***hidden***' }}")
+    # Simulate API call, then success
+    state.result = f"✓ Password reset for {state.username}\n   New password: {new_password}"
+    state.next_step = "end"
 
-    # Simulate success
-    state["result"] = f"✓ Password reset for {state['username']}\n   New password: {new_password}"
-    state["next_step"] = "end"
-
-    print(f"   {state['result']}")
+    # Only build the trace if someone is going to see it
+    if log.isEnabledFor(logging.INFO):
+        log.info("\n".join([
+            f"\n🔑 PASSWORD AGENT: Resetting password for user '{state.username}'",
+            "   📡 Calling Fusion HCM API... (simulated)",
+            f"   PATCH /api/users/{state.username}",
+            "   Body: { 'password': '***hidden***' }",
+            f"   {state.result}",
+        ]))
 
     return state
 
 
-def unlock_agent(state: AgentState) -> AgentState:
+async def unlock_agent(state: AgentState) -> AgentState:
     """
     Unlocks a locked user account.
     """
 
-    print(f"\n🔓 UNLOCK AGENT: Unlocking user '{state['username']}'")
-
-    print("   📡 Calling Fusion HCM API... (simulated)")
-    print(f"   PATCH /api/users/{state['username']}")
-    print(f"   Body: {{ 'locked': false }}")
+    # Simulate API call, then success
+    state.result = f"✓ Successfully unlocked user {state.username}"
+    state.next_step = "end"
 
-    # Simulate success
-    state["result"] = f"✓ Successfully unlocked user {state['username']}"
-    state["next_step"] = "end"
-
-    print(f"   {state['result']}")
+    # Only build the trace if someone is going to see it
+    if log.isEnabledFor(logging.INFO):
+        log.info("\n".join([
+            f"\n🔓 UNLOCK AGENT: Unlocking user '{state.username}'",
+            "   📡 Calling Fusion HCM API... (simulated)",
+            f"   PATCH /api/users/{state.username}",
+            "   Body: { 'locked': false }",
+            f"   {state.result}",
+        ]))
 
     return state
 
 
 # Test each agent
 if __name__ == "__main__":
+    logging.basicConfig(format="%(message)s", stream=sys.stdout)
+    log.setLevel(logging.INFO)
+
     print("Testing Role Agent:")
     test_state = AgentState(
         messages=["test"],
@@ -94,7 +108,7 @@ if __name__ == "__main__":
         result="",
         next_step="role_agent"
     )
-    role_agent(test_state)
+    asyncio.run(role_agent(test_state))
 
     print("\n" + "=" * 50)
     print("Testing Password Agent:")
@@ -106,7 +120,7 @@ if __name__ == "__main__":
         result="",
         next_step="password_agent"
     )
-    password_agent(test_state)
+    asyncio.run(password_agent(test_state))
 
     print("\n" + "=" * 50)
     print("Testing Unlock Agent:")
@@ -118,4 +132,4 @@ if __name__ == "__main__":
         result="",
         next_step="unlock_agent"
     )
-    unlock_agent(test_state)
\ No newline at end of file
+    asyncio.run(unlock_agent(test_state))
\ No newline at end of file
@@ -4,13 +4,51 @@ Main Application - Simple Interactive Demo
 This is the entry point. Run this to try the system!
 """
 
-from workflow import create_workflow
+import asyncio
+import importlib
+import logging
+import os
+import sys
+import threading
+import uuid
+
+from dotenv import load_dotenv
+
 from state import AgentState
 
+# Slow imports (LangGraph, LangChain and the LLM clients) that can load
+# in the background while the user types their first request
+SLOW_IMPORTS = (
+    "langgraph.graph",
+    "langgraph.checkpoint.memory",
+    "langchain_core.prompts",
+    "langchain_ollama",
+    "supervisor",
+    "agents",
+)
+
+
+def preload():
+    """Import the slow modules so they are ready when we need them"""
+    for name in SLOW_IMPORTS:
+        importlib.import_module(name)
+
 
 def main():
     """Run the interactive demo"""
 
+    # Read .env first so settings like AGENT_LOG_LEVEL can live there too
+    load_dotenv()
+
+    # Show what each agent is doing (set AGENT_LOG_LEVEL=WARNING to hide it)
+    logging.basicConfig(format="%(message)s", stream=sys.stdout)
+    level_name = os.getenv("AGENT_LOG_LEVEL", "INFO").strip().upper()
+    level = logging.getLevelName(level_name)  # an int for known names
+    if not isinstance(level, int):
+        logging.warning("Unknown AGENT_LOG_LEVEL %r, using INFO", level_name)
+        level = logging.INFO
+    logging.getLogger("hcm_agent").setLevel(level)
+
     print("=" * 70)
     print("  🤖 Simple Fusion HCM Agent - LangGraph Learning Demo")
     print("=" * 70)
@@ -18,15 +56,94 @@ def main():
     print("  • Assign HR Manager role to john.doe")
     print("  • Reset password for jane.smith")
     print("  • Unlock user bob.jones")
-    print("\nType 'quit' to exit\n")
+    print("\nSeparate several commands with ';' to run them together.")
+    print("\nType 'retry' to resume a request that failed, 'quit' to exit\n")
     print("=" * 70)
 
-    # Build the workflow once
-    app = create_workflow()
+    # Let the user start typing right away instead of waiting for imports.
+    # Only the imports go to a (daemon) thread; input() stays on the main
+    # thread so Ctrl-C at the prompt still exits immediately.
+    loader = threading.Thread(target=preload, daemon=True)
+    loader.start()
+    first_input = input("\n💬 You: ")
+    loader.join()
+
+    from langgraph.checkpoint.memory import InMemorySaver
+    from workflow import create_workflow
+
+    # Build the workflow once. Checkpoints only need to live as long as
+    # this session (that's all 'retry' can reach), and they contain new
+    # passwords, so they are kept in memory rather than on disk.
+    app = create_workflow(checkpointer=InMemorySaver())
+    run_repl(app, first_input)
+
+
+def new_state(user_input: str) -> AgentState:
+    """Create the initial state for one user request"""
+    return AgentState(messages=[user_input])
+
+
+async def run_request(app, initial_state, config):
+    """
+    Run one request, showing the agent's result as soon as it is ready.
+
+    Returns the final state once the whole workflow has finished.
+    """
+    final_state = None
+    async for event in app.astream_events(initial_state, config, version="v2"):
+        if event["event"] != "on_chain_end":
+            continue
+
+        if not event["parent_ids"]:
+            # The workflow itself finished (its output is a plain dict)
+            final_state = event["data"]["output"]
+        elif event["name"] == event["metadata"].get("langgraph_node"):
+            # A node (agent) finished; show its result right away
+            output = event["data"]["output"]
+            if isinstance(output, AgentState) and output.result:
+                print(f"\n🤖 Agent:\n   {output.result}", flush=True)
+
+    return final_state
+
+
+async def run_batch(app, runs):
+    """Run several requests at the same time"""
+    return await asyncio.gather(
+        *(run_request(app, initial_state, config) for initial_state, config in runs),
+        return_exceptions=True
+    )
+
+
+def run_repl(app, first_input=None):
+    """
+    Read requests from the user and run each one through the workflow.
+
+    The prompt is read outside the event loop (asyncio's Ctrl-C handling
+    can't interrupt a blocking input() call), and every batch runs on the
+    same loop so the LLM client can keep its connections.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        _repl_loop(app, loop, first_input)
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+def _repl_loop(app, loop, first_input):
+    """The read-run-print loop behind run_repl()"""
+
+    # Every request gets its own checkpoint thread within this session
+    session_id = uuid.uuid4().hex
+    turn = 0
+    failed_configs = []
 
     while True:
-        # Get user input
-        user_input = input("\n💬 You: ").strip()
+        # Get user input (the first request may already have been typed)
+        if first_input is not None:
+            user_input, first_input = first_input.strip(), None
+        else:
+            user_input = input("\n💬 You: ").strip()
 
         if user_input.lower() in ['quit', 'exit', 'q']:
             print("\n👋 Goodbye!\n")
@@ -35,30 +152,39 @@ def main():
         if not user_input:
             continue
 
-        # Create initial state with user's message
-        initial_state = AgentState(
-            messages=[user_input],
-            action="",
-            username="",
-            extra_info="",
-            result="",
-            next_step="supervisor"
-        )
-
-        try:
-            # Run the workflow!
-            print("\n" + "─" * 70)
-            final_state = app.invoke(initial_state)
-
-            # Show the result
-            print("\n" + "─" * 70)
-            print("\n🤖 Agent:")
-            print(f"   {final_state['result']}")
-            print()
-
-        except Exception as e:
-            print(f"\n❌ Error: {e}")
-            print("Please try again with a different request.\n")
+        if user_input.lower() == 'retry':
+            if not failed_configs:
+                print("\nNothing to retry.")
+                continue
+            # Passing None resumes from the last checkpoint, so steps
+            # that already finished (like the supervisor) don't run again
+            runs = [(None, config) for config in failed_configs]
+        else:
+            turn += 1
+            commands = [command.strip() for command in user_input.split(";") if command.strip()]
+            runs = [
+                (new_state(command), {"configurable": {"thread_id": f"{session_id}-{turn}-{i}"}})
+                for i, command in enumerate(commands, start=1)
+            ]
+
+        # Run the workflow! Each command is independent, so they all
+        # run at the same time instead of one after another
+        print("\n" + "─" * 70)
+        outcomes = loop.run_until_complete(run_batch(app, runs))
+        print("\n" + "─" * 70)
+
+        # Results were shown as they arrived; report what didn't work
+        failed_configs = []
+        for (_, config), outcome in zip(runs, outcomes):
+            if isinstance(outcome, Exception):
+                failed_configs.append(config)
+                print(f"\n❌ Error: {outcome}")
+            elif not outcome["result"]:
+                print(f"\n🤷 Couldn't work out what to do with: '{outcome['messages'][0]}'")
+        print()
+
+        if failed_configs:
+            print("Type 'retry' to resume what failed, or try a different request.\n")
 
 
 if __name__ == "__main__":
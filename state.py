@@ -5,32 +5,46 @@ This is the most important concept in LangGraph!
 The state holds all information as it flows through the agents.
 """
 
-from typing import TypedDict, List
+from collections import deque
+from dataclasses import dataclass, field
 
+# How many messages the state keeps; older ones are dropped
+MAX_MESSAGES = 100
 
-class AgentState(TypedDict):
+
+@dataclass(slots=True)
+class AgentState:
     """
     This is like a shared notebook that all agents can read and write to.
     As the state moves from agent to agent, they add information to it.
+
+    It's a slotted dataclass, so agents read and write fields as
+    attributes (state.username) and each state stays small in memory.
     """
 
     # The conversation messages
-    messages: List[str]  # Simple list of messages
+    messages: deque[str] = field(default_factory=lambda: deque(maxlen=MAX_MESSAGES))  # Newest last
 
     # What the user wants to do
-    action: str  # "assign_role", "reset_password", or "unlock_user"
+    action: str = ""  # "assign_role", "reset_password", or "unlock_user"
 
     # Who to perform the action on
-    username: str  # e.g., "john.doe"
+    username: str = ""  # e.g., "john.doe"
 
     # Extra information (like role name for assignment)
-    extra_info: str  # e.g., "HR Manager"
+    extra_info: str = ""  # e.g., "HR Manager"
 
     # Did it work?
-    result: str  # The final result message
+    result: str = ""  # The final result message
 
     # Which agent should handle this next?
-    next_step: str  # "supervisor", "role_agent", "password_agent", "unlock_agent", or "end"
+    next_step: str = "supervisor"  # "supervisor", "role_agent", "password_agent", "unlock_agent", or "end"
+
+    def __post_init__(self):
+        # Accept a plain list too (e.g. AgentState(messages=["hi"])) and
+        # make sure the history can never grow past MAX_MESSAGES
+        if not isinstance(self.messages, deque) or self.messages.maxlen != MAX_MESSAGES:
+            self.messages = deque(self.messages, maxlen=MAX_MESSAGES)
 
 
 # Example of how state flows:
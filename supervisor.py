@@ -6,83 +6,234 @@ This agent looks at what the user wants and decides:
 - Which agent should handle it
 """
 
-from langchain_openai import ChatOpenAI
+import asyncio
+import logging
+import re
+import sys
+from collections import OrderedDict
+from functools import lru_cache
 from state import AgentState
 import os
-from dotenv import load_dotenv
-from langchain_ollama import ChatOllama
-load_dotenv()
+
+# Shared with the agents; see agents.py
+log = logging.getLogger("hcm_agent")
+
+
+# Which agent handles each action
+_ACTION_TO_AGENT = {
+    "assign_role": "role_agent",
+    "reset_password": "password_agent",
+    "unlock_user": "unlock_agent"
+}
+
+# Simple commands we can understand without asking the LLM.
+# Usernames must look like an identifier, and the keywords "user" and
+# "role" are never taken as the username or role name. Anything that
+# doesn't match goes to the LLM as before.
+_FAST_PATHS = [
+    (
+        "assign_role",
+        re.compile(
+            r"assign\s+(?:role\s+)?(?!role\b)(?P<extra>.+?)\s+(?:role\s+)?to\s+(?:user\s+)?(?!user\b)(?P<username>[\w.@-]+?)[.!]?",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        "reset_password",
+        re.compile(
+            r"reset\s+(?:the\s+)?password\s+(?:for|of)\s+(?:user\s+)?(?!user\b)(?P<username>[\w.@-]+?)[.!]?",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        "unlock_user",
+        re.compile(
+            r"unlock\s+(?:user\s+)?(?!user\b)(?P<username>[\w.@-]+?)[.!]?",
+            re.IGNORECASE,
+        ),
+    ),
+]
+
+# The prompt text; only {user_message} changes per request
+_PROMPT_TEMPLATE = """
+You are analyzing a user request for an HCM system.
+
+User request: "{user_message}"
+
+Determine:
+1. What action? (assign_role, reset_password, or unlock_user)
+2. Which username?
+3. Any extra info? (like role name if assigning a role)
+
+Respond in this EXACT format:
+ACTION: <action>
+USERNAME: <username>
+EXTRA: <extra info or "none">
+
+Example:
+ACTION: assign_role
+USERNAME: john.doe
+EXTRA: HR Manager
+"""
+
+# One "FIELD: value" line of the LLM's answer, and the state key it fills
+_ANSWER_LINE = re.compile(r"^\s*(ACTION|USERNAME|EXTRA):[ \t]*(.*?)\s*$", re.MULTILINE)
+_ANSWER_FIELDS = {"ACTION": "action", "USERNAME": "username", "EXTRA": "extra_info"}
+
+# LLM answers for requests we've already seen, most recently used last
+_DECISION_CACHE = OrderedDict()
+_DECISION_CACHE_SIZE = 256
 
 
-def supervisor_agent(state: AgentState) -> AgentState:
+@lru_cache(maxsize=1)
+def _get_llm():
     """
-    The supervisor reads the user's message and figures out what to do.
+    Build the LLM client once and reuse it for every request.
 
-    Think of it like a receptionist who directs you to the right department!
+    Creating the client sets up its HTTP connection, so we don't want
+    to pay for that on every message. The LLM libraries are imported
+    here rather than at the top, because they are slow to import and
+    requests handled by the fast path never need them.
     """
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    # The answer is three short lines, so cap the output and keep the
+    # model deterministic. Set OLLAMA_MODEL to try a smaller model,
+    # e.g. "qwen2:0.5b".
+    # from langchain_openai import ChatOpenAI
+    # return ChatOpenAI(model="gpt-4o-mini", temperature=0, max_tokens=80)
+    import httpx
+    from langchain_ollama import ChatOllama
+    return ChatOllama(
+        model=os.getenv("OLLAMA_MODEL", "qwen2:1.5b"),
+        temperature=0,
+        num_predict=80,
+        # httpx closes idle connections after 5 seconds by default, which is
+        # shorter than the pause between two requests in the REPL. Keeping
+        # them open longer means the next request reuses the connection.
+        client_kwargs={"limits": httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60)},
+    )
 
-    print("\n🧠 SUPERVISOR: Analyzing the request...")
-    user_message = state["messages"][0]
-    print(f"   User said: '{user_message}'")
 
-    # Use GPT to understand what the user wants
+@lru_cache(maxsize=1)
+def _get_chain():
+    """
+    The whole prompt -> LLM -> parse pipeline, put together once and reused.
+
+    Calling it with {"user_message": ...} returns the parsed decision.
+    """
+    from langchain_core.output_parsers import StrOutputParser
+    from langchain_core.prompts import ChatPromptTemplate
+    return (
+        ChatPromptTemplate.from_template(_PROMPT_TEMPLATE)
+        | _get_llm()
+        | StrOutputParser()
+        | _parse_answer
+    )
+
+
+def _parse_answer(decision: str) -> dict:
+    """
+    Turn the LLM's "FIELD: value" lines into state updates.
+    """
+    log.info("   GPT's analysis:\n%s", decision)
 
-    llm = ChatOllama(model="qwen2:1.5b")
-    # llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    parsed = {}
+    for field, value in _ANSWER_LINE.findall(decision):
+        parsed[_ANSWER_FIELDS[field]] = value if value != "none" else ""
+    return parsed
 
-    prompt = f"""
-    You are analyzing a user request for an HCM system.
 
-    User request: "{user_message}"
+def _match_fast_path(user_message: str) -> dict | None:
+    """
+    Try to understand the request with a regex instead of the LLM.
+
+    Returns the decision (action, username, extra_info) or None if the
+    message isn't one of the simple commands.
+    """
+    for action, pattern in _FAST_PATHS:
+        match = pattern.fullmatch(user_message.strip())
+        if match:
+            groups = match.groupdict()
+            return {
+                "action": action,
+                "username": groups["username"],
+                "extra_info": groups.get("extra") or "",
+            }
+    return None
+
+
+async def _ask_llm(user_message: str) -> dict:
+    """
+    Ask the LLM what the user wants and parse its answer.
+
+    Only the fields the LLM actually answered are returned. Answers are
+    remembered, so repeating the same request skips the LLM call.
+    """
+    cache_key = " ".join(user_message.split())
+    cached = _DECISION_CACHE.get(cache_key)
+    if cached is not None:
+        _DECISION_CACHE.move_to_end(cache_key)
+        log.info("   ♻️  Seen this request before, reusing the LLM's answer")
+        return dict(cached)
+
+    # Use GPT to understand what the user wants
+    parsed = await _get_chain().ainvoke({"user_message": user_message})
 
-    Determine:
-    1. What action? (assign_role, reset_password, or unlock_user)
-    2. Which username?
-    3. Any extra info? (like role name if assigning a role)
+    # Only remember answers we can actually route
+    if parsed.get("action") in _ACTION_TO_AGENT:
+        _DECISION_CACHE[cache_key] = dict(parsed)
+        if len(_DECISION_CACHE) > _DECISION_CACHE_SIZE:
+            _DECISION_CACHE.popitem(last=False)
 
-    Respond in this EXACT format:
-    ACTION: <action>
-    USERNAME: <username>
-    EXTRA: <extra info or "none">
+    return parsed
 
-    Example:
-    ACTION: assign_role
-    USERNAME: john.doe
-    EXTRA: HR Manager
+
+async def supervisor_agent(state: AgentState) -> AgentState:
+    """
+    The supervisor reads the user's message and figures out what to do.
+
+    Think of it like a receptionist who directs you to the right department!
     """
 
-    response = llm.invoke(prompt)
-    decision = response.content
+    user_message = state.messages[0]
 
-    print(f"   GPT's analysis:\n{decision}")
+    # Collect the trace and log it in one go, but only if someone is
+    # going to see it
+    tracing = log.isEnabledFor(logging.INFO)
+    lines = []
+    if tracing:
+        lines = ["\n🧠 SUPERVISOR: Analyzing the request...", f"   User said: '{user_message}'"]
 
-    # Parse GPT's response
-    lines = decision.strip().split('\n')
-    for line in lines:
-        if line.startswith("ACTION:"):
-            state["action"] = line.replace("ACTION:", "").strip()
-        elif line.startswith("USERNAME:"):
-            state["username"] = line.replace("USERNAME:", "").strip()
-        elif line.startswith("EXTRA:"):
-            extra = line.replace("EXTRA:", "").strip()
-            state["extra_info"] = extra if extra != "none" else ""
+    decision = _match_fast_path(user_message)
+    if decision is not None:
+        lines.append("   ⚡ Simple command, skipping the LLM")
+    else:
+        # Show what we have so far before waiting on the LLM
+        if tracing:
+            log.info("\n".join(lines))
+            lines = []
+        decision = await _ask_llm(user_message)
 
-    # Decide which agent to route to
-    action_to_agent = {
-        "assign_role": "role_agent",
-        "reset_password": "password_agent",
-        "unlock_user": "unlock_agent"
-    }
+    for key, value in decision.items():
+        setattr(state, key, value)
 
-    state["next_step"] = action_to_agent.get(state["action"], "end")
+    # Decide which agent to route to
+    state.next_step = _ACTION_TO_AGENT.get(state.action, "end")
 
-    print(f"   ✓ Decision: Route to '{state['next_step']}'")
+    if tracing:
+        lines.append(f"   ✓ Decision: Route to '{state.next_step}'")
+        log.info("\n".join(lines))
 
     return state
 
 
 # Test it standalone
 if __name__ == "__main__":
+    logging.basicConfig(format="%(message)s", stream=sys.stdout)
+    log.setLevel(logging.INFO)
+
     # Example test
     test_state = AgentState(
         messages=["Assign HR Manager role to john.doe"],
@@ -93,5 +244,5 @@ if __name__ == "__main__":
         next_step="supervisor"
     )
 
-    result = supervisor_agent(test_state)
+    result = asyncio.run(supervisor_agent(test_state))
     print(f"\nFinal state: {result}")
\ No newline at end of file
@@ -8,6 +8,8 @@ We define:
 3. Routing logic (which agent to go to next)
 """
 
+import asyncio
+import logging
 import sys
 import os
 
@@ -21,21 +23,27 @@ from state import AgentState
 from supervisor import supervisor_agent
 from agents import role_agent, password_agent, unlock_agent
 
+# Shared with the agents; see agents.py
+log = logging.getLogger("hcm_agent")
 
-def create_workflow():
+
+def create_workflow(checkpointer=None):
     """
     This function builds the entire agent workflow.
 
     Think of it like building a flowchart!
+
+    Pass a checkpointer to save the state after every step, so a run
+    that fails halfway can be resumed instead of starting over.
     """
 
-    print("🔧 Building the workflow...")
+    log.info("🔧 Building the workflow...")
 
     # Step 1: Create the graph with our state
     workflow = StateGraph(AgentState)
 
     # Step 2: Add nodes (each node is an agent)
-    print("   Adding nodes (agents)...")
+    log.info("   Adding nodes (agents)...")
     workflow.add_node("supervisor", supervisor_agent)
     workflow.add_node("role_agent", role_agent)
     workflow.add_node("password_agent", password_agent)
@@ -46,9 +54,9 @@ def create_workflow():
     def route_to_next(state: AgentState) -> str:
         """
         This is the 'traffic controller'.
-        It reads state["next_step"] and decides where to route.
+        It reads state.next_step and decides where to route.
         """
-        next_step = state["next_step"]
+        next_step = state.next_step
 
         if next_step == "end":
             return END  # Special LangGraph constant meaning "we're done!"
@@ -77,10 +85,10 @@ def create_workflow():
     workflow.add_edge("unlock_agent", END)
 
     # Step 6: Compile the graph
-    print("   Compiling the graph...")
-    app = workflow.compile()
+    log.info("   Compiling the graph...")
+    app = workflow.compile(checkpointer=checkpointer)
 
-    print("   ✓ Workflow ready!\n")
+    log.info("   ✓ Workflow ready!\n")
 
     return app
 
@@ -105,6 +113,9 @@ agent_workflow = create_workflow()
 """
 
 if __name__ == "__main__":
+    logging.basicConfig(format="%(message)s", stream=sys.stdout)
+    log.setLevel(logging.INFO)
+
     # Test the workflow
     print("=" * 60)
     print("Testing the Complete Workflow")
@@ -123,13 +134,13 @@ if __name__ == "__main__":
     )
 
     print("\n📥 Initial state:")
-    print(f"   User message: {initial_state['messages'][0]}")
+    print(f"   User message: {initial_state.messages[0]}")
 
     # Run the workflow!
     print("\n🚀 Running the workflow...")
     print("=" * 60)
 
-    final_state = app.invoke(initial_state)
+    final_state = asyncio.run(app.ainvoke(initial_state))
 
     print("\n" + "=" * 60)
     print("📤 Final Result:")
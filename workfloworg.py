@@ -8,6 +8,9 @@ We define:
 3. Routing logic (which agent to go to next)
 """
 
+import asyncio
+import logging
+import sys
 from langgraph.graph import StateGraph, END
 from state import AgentState
 from supervisor import supervisor_agent
@@ -38,9 +41,9 @@ def create_workflow():
     def route_to_next(state: AgentState) -> str:
         """
         This is the 'traffic controller'.
-        It reads state["next_step"] and decides where to route.
+        It reads state.next_step and decides where to route.
         """
-        next_step = state["next_step"]
+        next_step = state.next_step
 
         if next_step == "end":
             return END  # Special LangGraph constant meaning "we're done!"
@@ -93,6 +96,9 @@ def create_workflow():
 """
 
 if __name__ == "__main__":
+    logging.basicConfig(format="%(message)s", stream=sys.stdout)
+    logging.getLogger("hcm_agent").setLevel(logging.INFO)
+
     # Test the workflow
     print("=" * 60)
     print("Testing the Complete Workflow")
@@ -111,13 +117,13 @@ if __name__ == "__main__":
     )
 
     print("\n📥 Initial state:")
-    print(f"   User message: {initial_state['messages'][0]}")
+    print(f"   User message: {initial_state.messages[0]}")
 
     # Run the workflow!
     print("\n🚀 Running the workflow...")
     print("=" * 60)
 
-    final_state = app.invoke(initial_state)
+    final_state = asyncio.run(app.ainvoke(initial_state))
 
     print("\n" + "=" * 60)
     print("📤 Final Result:")